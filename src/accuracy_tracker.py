@@ -0,0 +1,230 @@
+# accuracy_tracker.py
+import math
+import threading
+from collections import OrderedDict, deque
+import pandas as pd
+
+from config import (
+    ACCURACY_WINDOWS,
+    ACCURACY_MIN_SAMPLES,
+    ACCURACY_MAPE_ALERT,
+    ACCURACY_HIT_RATE_ALERT,
+    PREDICTION_HISTORY,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RollingErrorWindow:
+    """
+    Running MAE / MAPE / RMSE / directional hit-rate over the last
+    `minutes` minutes of matched (prediction, candle) pairs.
+    Sums are updated incrementally — O(1) amortized per sample.
+    """
+
+    def __init__(self, minutes):
+        self.minutes = minutes
+        self.span = pd.Timedelta(minutes=minutes)
+        self.samples = deque()
+
+        self.sum_abs = 0.0
+        self.sum_pct = 0.0
+        self.sum_sq = 0.0
+        self.hits = 0
+        self.directional = 0
+
+    def add(self, ts, abs_err, pct_err, hit):
+        # hit is None when direction is undefined (flat move / no reference)
+        self.samples.append((ts, abs_err, pct_err, hit))
+        self.sum_abs += abs_err
+        self.sum_pct += pct_err
+        self.sum_sq += abs_err * abs_err
+        if hit is not None:
+            self.directional += 1
+            self.hits += int(hit)
+
+        self.evict(ts)
+
+    def evict(self, now_ts):
+        cutoff = now_ts - self.span
+        while self.samples and self.samples[0][0] <= cutoff:
+            _, abs_err, pct_err, hit = self.samples.popleft()
+            self.sum_abs -= abs_err
+            self.sum_pct -= pct_err
+            self.sum_sq -= abs_err * abs_err
+            if hit is not None:
+                self.directional -= 1
+                self.hits -= int(hit)
+
+    def stats(self):
+        n = len(self.samples)
+        if n == 0:
+            return {"n": 0, "mae": None, "mape": None, "rmse": None, "hit_rate": None}
+
+        return {
+            "n": n,
+            "mae": self.sum_abs / n,
+            "mape": self.sum_pct / n * 100,
+            # clamp tiny negative drift from repeated add/subtract
+            "rmse": math.sqrt(max(self.sum_sq, 0.0) / n),
+            "hit_rate": (self.hits / self.directional * 100) if self.directional else None,
+        }
+
+
+class AccuracyTracker:
+    """
+    Streaming live-accuracy evaluator.
+
+    Predictions are indexed by their `predict_for_ts`; every finalized
+    candle is looked up by its close time ('datetime' + 1 min, since
+    candles are labelled by the minute they open) in O(1) and folded
+    into the rolling windows. Results are published to
+    shared['accuracy'] for the dashboard, and
+    `on_alert(window_minutes, stats)` is called when a window crosses
+    the degradation thresholds.
+    """
+
+    def __init__(self, shared, windows=ACCURACY_WINDOWS, on_alert=None,
+                 min_samples=ACCURACY_MIN_SAMPLES,
+                 mape_alert=ACCURACY_MAPE_ALERT,
+                 hit_rate_alert=ACCURACY_HIT_RATE_ALERT,
+                 max_pending=PREDICTION_HISTORY):
+        self.lock = threading.RLock()
+        self.shared = shared
+        self.windows = [RollingErrorWindow(m) for m in sorted(windows)]
+        self.on_alert = on_alert or self._log_alert
+
+        self.min_samples = min_samples
+        self.mape_alert = mape_alert
+        self.hit_rate_alert = hit_rate_alert
+        self.max_pending = max_pending
+
+        # predict_for_ts -> (predicted_price, reference_close)
+        # Insertion order == time order, so stale entries sit at the front.
+        self.pending = OrderedDict()
+        self.last_close = None
+        self.degraded = {w.minutes: False for w in self.windows}
+
+        with self.shared["lock"]:
+            self.shared["accuracy"] = self._snapshot()
+
+    def record_prediction(self, predict_for_ts, pred_price, reference_close=None):
+        """Index a prediction so the candle closing at `predict_for_ts` can be scored."""
+        ts = pd.Timestamp(predict_for_ts)
+        with self.lock:
+            self.pending[ts] = (float(pred_price), reference_close)
+            self.pending.move_to_end(ts)
+            while len(self.pending) > self.max_pending:
+                self.pending.popitem(last=False)
+
+    def on_candle(self, candle):
+        """Score a finalized candle against its prediction (if any)."""
+        # Candles are labelled by their opening minute; predictions by close time
+        ts = pd.Timestamp(candle["datetime"]) + pd.Timedelta(minutes=1)
+        actual = float(candle["close"])
+
+        with self.lock:
+            prev_close = self.last_close
+            self.last_close = actual
+
+            entry = self.pending.pop(ts, None)
+
+            # Drop predictions for minutes that never produced a candle
+            while self.pending:
+                oldest = next(iter(self.pending))
+                if oldest >= ts:
+                    break
+                self.pending.popitem(last=False)
+
+            if entry is not None:
+                pred, reference = entry
+                if reference is None:
+                    reference = prev_close
+
+                abs_err = abs(actual - pred)
+                pct_err = abs_err / abs(actual) if actual else 0.0
+
+                hit = None
+                if reference is not None:
+                    pred_move = pred - reference
+                    actual_move = actual - reference
+                    if pred_move != 0 and actual_move != 0:
+                        hit = (pred_move > 0) == (actual_move > 0)
+
+                for w in self.windows:
+                    w.add(ts, abs_err, pct_err, hit)
+            else:
+                # Still age out old samples when nothing was predicted
+                for w in self.windows:
+                    w.evict(ts)
+
+            snapshot = self._snapshot()
+            alerts = self._check_alerts(snapshot)
+
+        with self.shared["lock"]:
+            self.shared["accuracy"] = snapshot
+
+        if entry is not None:
+            logger.info(
+                f"Accuracy @ {ts}: actual {actual:.2f} vs pred {pred:.2f} "
+                f"(err {actual - pred:+.2f}) | " + self.format_summary(snapshot)
+            )
+
+        for minutes, stats in alerts:
+            try:
+                self.on_alert(minutes, stats)
+            except Exception as e:
+                logger.exception(f"Accuracy alert hook failed: {e}")
+
+        return snapshot
+
+    def _snapshot(self):
+        return {w.minutes: w.stats() for w in self.windows}
+
+    def _check_alerts(self, snapshot):
+        """Edge-triggered: fire once when a window degrades, log on recovery."""
+        alerts = []
+        for minutes, stats in snapshot.items():
+            if stats["n"] < self.min_samples:
+                # Window drained (e.g. overnight gap) — re-arm the alert
+                if self.degraded[minutes]:
+                    logger.info(f"Accuracy recovered on {minutes}m window (too few samples).")
+                self.degraded[minutes] = False
+                continue
+
+            bad = stats["mape"] > self.mape_alert or (
+                stats["hit_rate"] is not None
+                and stats["hit_rate"] < self.hit_rate_alert
+            )
+
+            if bad and not self.degraded[minutes]:
+                alerts.append((minutes, stats))
+            elif not bad and self.degraded[minutes]:
+                logger.info(f"Accuracy recovered on {minutes}m window.")
+
+            self.degraded[minutes] = bad
+        return alerts
+
+    @staticmethod
+    def _log_alert(minutes, stats):
+        logger.warning(
+            f"⚠ Accuracy degraded on {minutes}m window: "
+            + AccuracyTracker.format_window(stats)
+        )
+
+    @staticmethod
+    def format_window(stats):
+        if stats["n"] == 0:
+            return "—"
+        hit = "—" if stats["hit_rate"] is None else f"{stats['hit_rate']:.0f}%"
+        return (
+            f"MAE {stats['mae']:.2f} MAPE {stats['mape']:.3f}% "
+            f"RMSE {stats['rmse']:.2f} Hit {hit} (n={stats['n']})"
+        )
+
+    @staticmethod
+    def format_summary(snapshot):
+        return " | ".join(
+            f"{m}m: {AccuracyTracker.format_window(s)}" for m, s in snapshot.items()
+        )
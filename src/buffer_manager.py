@@ -3,6 +3,9 @@ import threading
 from collections import deque
 from config import LOOKBACK
 import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
 
 class CandleBuffer:
     """
@@ -14,6 +17,8 @@ class CandleBuffer:
         self.lookback = lookback
         # Exact size needed by predictor + a bit extra for debugging
         self.deque = deque(maxlen=lookback + 5)
+        # Callbacks invoked with each finalized live candle
+        self.listeners = []
 
     def load_from_csv(self, csv_path, datetime_col='date',
                     feature_cols=['open','high','low','close'], n=None):
@@ -51,10 +56,23 @@ class CandleBuffer:
 
         return len(self.deque)
 
+    def add_listener(self, callback):
+        """Register callback(candle) to run after every append_candle."""
+        with self.lock:
+            self.listeners.append(callback)
+
     def append_candle(self, candle):
         """Append a finalized candle into the buffer (thread-safe)."""
         with self.lock:
             self.deque.append(candle)
+            listeners = list(self.listeners)
+
+        # Notify outside the lock so slow listeners don't block readers
+        for callback in listeners:
+            try:
+                callback(candle)
+            except Exception as e:
+                logger.exception(f"Candle listener failed: {e}")
 
     def get_last_n(self, n=None):
         """Return list of last n candles (ascending time)."""
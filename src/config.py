@@ -17,5 +17,11 @@ PREDICTION_HISTORY = 300
 DASHBOARD_UPDATE_INTERVAL = 1.0
 PREDICTION_PERIOD_SEC = 60
 
+# Live Accuracy Parameters
+ACCURACY_WINDOWS = (15, 60, 375)     # rolling windows in minutes (375 = full session)
+ACCURACY_MIN_SAMPLES = 10            # matched candles before a window can alert
+ACCURACY_MAPE_ALERT = 0.10           # alert when MAPE (%) rises above this
+ACCURACY_HIT_RATE_ALERT = 45.0       # alert when directional hit-rate (%) drops below this
+
 # Secret Keys Path
 SMARTAPI_KEY_PATH = Path("/Users/api_keys.txt")
\ No newline at end of file
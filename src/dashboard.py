@@ -41,11 +41,12 @@ class LiveDashboard:
         with self.shared["lock"]:
             preds = list(self.shared["predictions"])
             pred_times = list(self.shared["timestamps"])
+            accuracy = dict(self.shared.get("accuracy", {}))
 
-        return df, times, closes, preds, pred_times
+        return df, times, closes, preds, pred_times, accuracy
 
 
-    def draw_stats(self, last_close, preds):
+    def draw_stats(self, last_close, preds, accuracy=None):
         self.ax_stats.clear()
         self.ax_stats.axis("off")
         self.ax_stats.set_facecolor("#111111")
@@ -79,6 +80,29 @@ class LiveDashboard:
             bbox=dict(facecolor="#222222", alpha=0.8, edgecolor="white")
         )
 
+        if accuracy:
+            self.draw_accuracy(accuracy)
+
+    def draw_accuracy(self, accuracy):
+        lines = ["LIVE ACCURACY\n"]
+        for minutes, stats in accuracy.items():
+            lines.append(f"{minutes}m  (n={stats['n']})")
+            if stats["n"] == 0:
+                lines.append("  —\n")
+                continue
+            hit = "—" if stats["hit_rate"] is None else f"{stats['hit_rate']:.0f}%"
+            lines.append(f"  MAE  {stats['mae']:.2f}   RMSE {stats['rmse']:.2f}")
+            lines.append(f"  MAPE {stats['mape']:.3f}%  Hit {hit}\n")
+
+        self.ax_stats.text(
+            0.05, 0.45, "\n".join(lines),
+            fontsize=11,
+            color="white",
+            family="monospace",
+            va="top",
+            bbox=dict(facecolor="#222222", alpha=0.8, edgecolor="white")
+        )
+
 
     def update(self, frame):
         data = self.get_data()
@@ -86,7 +110,7 @@ class LiveDashboard:
             # Return empty artists if no data
             return self.line,
 
-        df, times, closes, preds, pred_times = data
+        df, times, closes, preds, pred_times, accuracy = data
 
         # ---- Price chart ----
         self.ax_price.clear()
@@ -119,7 +143,7 @@ class LiveDashboard:
         self.ax_price.autoscale_view()
 
         last_close = closes[-1]
-        self.draw_stats(last_close, preds)
+        self.draw_stats(last_close, preds, accuracy)
 
         self.fig.autofmt_xdate()
 
@@ -8,6 +8,7 @@ from buffer_manager import CandleBuffer
 from ws_adapter import register_callbacks
 from predictor import PredictorThread
 from dashboard import LiveDashboard
+from accuracy_tracker import AccuracyTracker
 from config import DATA_CSV, LOOKBACK, SMARTAPI_KEY_PATH
 
 # SmartAPI imports
@@ -52,6 +53,7 @@ def main():
         'lock': threading.RLock(),
         'predictions': [],
         'timestamps': [],
+        'accuracy': {},
     }
 
     buffer = CandleBuffer(lookback=LOOKBACK)
@@ -62,6 +64,10 @@ def main():
         logger.warning(f"Warm-start failed: {e}. Buffer will fill from live ticks.")
 
 
+    # Score each live candle against its prediction
+    tracker = AccuracyTracker(shared)
+    buffer.add_listener(tracker.on_candle)
+
     sws = create_smartapi_connection()
 
     builder = register_callbacks(buffer, shared, sws)
@@ -77,7 +83,7 @@ def main():
     ws_thread.start()
     logger.info("WebSocket thread started.")
 
-    predictor = PredictorThread(buffer=buffer, shared_results=shared)
+    predictor = PredictorThread(buffer=buffer, shared_results=shared, tracker=tracker)
     predictor.start()
     logger.info("Predictor thread started.")
 
@@ -19,11 +19,13 @@ logger = logging.getLogger(__name__)
 
 class PredictorThread(threading.Thread):
 
-    def __init__(self, buffer, shared_results, model_path=None, scaler_path=None, daemon=True):
+    def __init__(self, buffer, shared_results, model_path=None, scaler_path=None,
+                 tracker=None, daemon=True):
         super().__init__(daemon=daemon)
 
         self.buffer = buffer
         self.shared = shared_results
+        self.tracker = tracker
         self.model, self.scaler, self.meta = load_model_and_scaler(
             model_path, scaler_path
         )
@@ -98,6 +100,10 @@ class PredictorThread(threading.Thread):
                     self.shared["predictions"].pop(0)
                     self.shared["timestamps"].pop(0)
 
+            # Index for live-accuracy scoring once the candle closes
+            if self.tracker is not None:
+                self.tracker.record_prediction(predict_for_ts, pred_price, last_close)
+
             logger.info(
                 f"✔ Predicted price for {predict_for_ts}: {pred_price:.2f}"
             )
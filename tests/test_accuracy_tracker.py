@@ -0,0 +1,154 @@
+# test_accuracy_tracker.py
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# src/ modules use flat imports (from config import ...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from accuracy_tracker import AccuracyTracker
+from buffer_manager import CandleBuffer
+from utils import mae, mape
+
+BASE = pd.Timestamp("2026-10-19 09:15")
+
+
+def make_shared():
+    return {
+        'lock': threading.RLock(),
+        'predictions': [],
+        'timestamps': [],
+        'accuracy': {},
+    }
+
+
+def candle(minute, close):
+    """Candle opening at BASE + minute (closes one minute later)."""
+    return {
+        'datetime': BASE + pd.Timedelta(minutes=minute),
+        'open': close, 'high': close, 'low': close, 'close': close,
+    }
+
+
+def close_ts(minute):
+    return BASE + pd.Timedelta(minutes=minute + 1)
+
+
+def test_matches_prediction_to_candle_closing_at_its_timestamp():
+    tracker = AccuracyTracker(make_shared(), windows=(15,))
+    tracker.record_prediction(close_ts(5), 101.0, reference_close=100.0)
+
+    # The candle opening one minute later must not be scored
+    snap = tracker.on_candle(candle(5, 101.0))
+    assert snap[15]["n"] == 1
+    assert snap[15]["mae"] == pytest.approx(0.0)
+    assert snap[15]["hit_rate"] == pytest.approx(100.0)
+
+    snap = tracker.on_candle(candle(6, 99.0))
+    assert snap[15]["n"] == 1
+
+
+def test_metrics_match_offline_utils():
+    rng = np.random.default_rng(0)
+    actual = 100 + rng.normal(0, 1, 40).cumsum()
+    preds = actual + rng.normal(0, 0.5, 40)
+
+    shared = make_shared()
+    tracker = AccuracyTracker(shared, windows=(15, 60), min_samples=10**6)
+    buffer = CandleBuffer()
+    buffer.add_listener(tracker.on_candle)
+
+    for i, (p, a) in enumerate(zip(preds, actual)):
+        tracker.record_prediction(close_ts(i), p)
+        buffer.append_candle(candle(i, float(a)))
+
+    full = shared["accuracy"][60]
+    assert full["n"] == 40
+    assert full["mae"] == pytest.approx(mae(actual, preds))
+    assert full["mape"] == pytest.approx(mape(actual, preds))
+    assert full["rmse"] == pytest.approx(np.sqrt(np.mean((actual - preds) ** 2)))
+
+    last = shared["accuracy"][15]
+    assert last["n"] == 15
+    assert last["mae"] == pytest.approx(mae(actual[-15:], preds[-15:]))
+    assert last["mape"] == pytest.approx(mape(actual[-15:], preds[-15:]))
+
+
+def test_eviction_at_15_minute_boundary():
+    tracker = AccuracyTracker(make_shared(), windows=(15,), min_samples=10**6)
+
+    for i in range(15):
+        tracker.record_prediction(close_ts(i), 100.0)
+        snap = tracker.on_candle(candle(i, 100.0))
+    assert snap[15]["n"] == 15
+
+    tracker.record_prediction(close_ts(15), 100.0)
+    snap = tracker.on_candle(candle(15, 100.0))
+    assert snap[15]["n"] == 15
+
+    # Unmatched candles still age samples out of the window
+    snap = tracker.on_candle(candle(16, 100.0))
+    assert snap[15]["n"] == 14
+    snap = tracker.on_candle(candle(40, 100.0))
+    assert snap[15]["n"] == 0
+
+
+def test_alert_fires_once_and_clears_on_recovery():
+    alerts = []
+    tracker = AccuracyTracker(
+        make_shared(), windows=(15,), min_samples=5,
+        mape_alert=0.5, hit_rate_alert=0.0,
+        on_alert=lambda minutes, stats: alerts.append(minutes),
+    )
+
+    # 2% error on every candle — degraded for the whole stretch
+    for i in range(20):
+        tracker.record_prediction(close_ts(i), 102.0)
+        tracker.on_candle(candle(i, 100.0))
+    assert alerts == [15]
+    assert tracker.degraded[15]
+
+    # Perfect predictions push the bad samples out of the window
+    for i in range(20, 40):
+        tracker.record_prediction(close_ts(i), 100.0)
+        tracker.on_candle(candle(i, 100.0))
+    assert alerts == [15]
+    assert not tracker.degraded[15]
+
+
+def test_alert_rearms_after_window_drains():
+    alerts = []
+    tracker = AccuracyTracker(
+        make_shared(), windows=(15,), min_samples=5,
+        mape_alert=0.5, hit_rate_alert=0.0,
+        on_alert=lambda minutes, stats: alerts.append(minutes),
+    )
+
+    # Day one: degraded session
+    for i in range(20):
+        tracker.record_prediction(close_ts(i), 102.0)
+        tracker.on_candle(candle(i, 100.0))
+    assert alerts == [15]
+
+    # Next day: the overnight gap empties the window, then degrades again
+    day_two = 24 * 60
+    for i in range(day_two, day_two + 20):
+        tracker.record_prediction(close_ts(i), 102.0)
+        tracker.on_candle(candle(i, 100.0))
+    assert alerts == [15, 15]
+    assert tracker.degraded[15]
+
+
+def test_listener_error_does_not_break_append():
+    buffer = CandleBuffer()
+
+    def boom(c):
+        raise RuntimeError("listener failure")
+
+    buffer.add_listener(boom)
+    buffer.append_candle(candle(0, 100.0))
+    assert buffer.size() == 1